@@ -1,15 +1,52 @@
 import os
 import re
+import time
+import threading
+from dataclasses import dataclass
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import orjson
+from cachetools import TTLCache
 from flask import Flask, request, render_template, jsonify
-from bs4 import BeautifulSoup
+from flask.json.provider import DefaultJSONProvider
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 from qbittorrentapi import Client
 from transmission_rpc import Client as transmissionrpc
 from deluge_web_client import DelugeWebClient as delugewebclient
 from dotenv import load_dotenv
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlencode, quote
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Serializes JSON with orjson instead of the standard library encoder."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+@dataclass(slots=True)
+class BookSummary:
+    """A book listed in AudiobookBay search results."""
+
+    title: str
+    link: str
+    cover: str
+    language: str
+    post_date: str
+    format: str
+    bitrate: str
+    file_size: str
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Load environment variables
 load_dotenv()
@@ -18,6 +55,14 @@ ABB_HOSTNAME = os.getenv("ABB_HOSTNAME", "audiobookbay.lu")
 
 PAGE_LIMIT = int(os.getenv("PAGE_LIMIT", 5))
 
+# Headers sent with every request to AudiobookBay
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
+}
+
+# Hosts that details pages may be fetched from
+ALLOWED_HOSTS = frozenset([ABB_HOSTNAME])
+
 DOWNLOAD_CLIENT = os.getenv("DOWNLOAD_CLIENT")
 DL_URL = os.getenv("DL_URL")
 if DL_URL:
@@ -43,6 +88,112 @@ SAVE_PATH_BASE = os.getenv("SAVE_PATH_BASE")
 NAV_LINK_NAME = os.getenv("NAV_LINK_NAME")
 NAV_LINK_URL = os.getenv("NAV_LINK_URL")
 
+# Scraped results, shared between request threads. Magnet links for a details
+# page rarely change, while search results can pick up new uploads.
+CACHE_LOCK = threading.Lock()
+search_cache = TTLCache(maxsize=256, ttl=600)
+# Details entries hold (magnet link, ETag, Last-Modified, fetch time). After
+# DETAILS_MAX_AGE seconds they are revalidated with a conditional request, and
+# the validators are kept for a day so a refresh can still be answered by a 304.
+DETAILS_MAX_AGE = 3600
+details_cache = TTLCache(maxsize=1024, ttl=86400)
+# Searches, details fetches and cover checks currently running, see coalesce()
+inflight_searches = {}
+inflight_details = {}
+inflight_covers = {}
+# Whether a cover image URL is reachable. TTLCache drops the least recently used
+# entries once full, and expiry lets covers that failed once be retried later.
+cover_cache = TTLCache(maxsize=4096, ttl=3600)
+# Cover hosts that recently refused or timed out a connection. Their other covers
+# are skipped for a minute instead of each waiting out the connect timeout.
+dead_cover_hosts = TTLCache(maxsize=64, ttl=60)
+
+# Download client shared across requests, created on first use
+_torrent_client = None
+_torrent_client_lock = threading.Lock()
+
+# Rendered search page without a query, built on the first visit
+_empty_search_html = None
+
+# How long (in seconds) torrent status is reused before asking the client again
+STATUS_CACHE_TTL = 5
+_status_ts = 0.0
+_status_torrents = None
+
+# Trackers used when a details page doesn't list any
+DEFAULT_TRACKERS = [
+    "udp://tracker.openbittorrent.com:80",
+    "udp://opentor.org:2710",
+    "udp://tracker.ccc.de:80",
+    "udp://tracker.blackunicorn.xyz:6969",
+    "udp://tracker.coppersurfer.tk:6969",
+    "udp://tracker.leechers-paradise.org:6969",
+]
+# The default trackers never change, so encode their magnet query once
+DEFAULT_TRACKERS_QUERY = urlencode(
+    {"tr": DEFAULT_TRACKERS}, doseq=True, safe="/", quote_via=quote
+)
+
+# Parts of a search result page that are scraped: the posts and the paginator
+SEARCH_PAGE_STRAINER = SoupStrainer(class_=["post", "wp-pagenavi"])
+
+# CSS selectors for search result pages, compiled once instead of on every call
+SEL_POSTS = sv.compile(".post")
+SEL_TITLE_LINK = sv.compile(".postTitle > h2 > a")
+SEL_COVER = sv.compile("img")
+SEL_POST_INFO = sv.compile(".postInfo")
+SEL_DETAILS_PARAGRAPH = sv.compile(".postContent p[style*='text-align:center']")
+SEL_PAGE_LINKS = sv.compile(".wp-pagenavi a[href]")
+
+# Release details in a post's centered paragraph, matched in a single pass. The
+# last named group of each alternative (match.lastgroup) tells the labels apart.
+DETAILS_FIELDS_RE = re.compile(
+    r"Posted:\s*(?P<posted>[^<]+)"
+    r"|Format:\s*<span[^>]*>(?P<format>[^<]+)</span>"
+    r"|Bitrate:\s*<span[^>]*>(?P<bitrate>[^<]+)</span>"
+    r"|File Size:\s*<span[^>]*>(?P<size>[^<]+)</span>\s*(?P<size_unit>[^<]+)"
+)
+
+# Language field of a post's .postInfo text
+LANGUAGE_RE = re.compile(r"Language:\s*(.*?)(?:\s*Keywords:|$)", re.DOTALL)
+
+# Page number in a paginator link
+PAGE_NUMBER_RE = re.compile(r"/page/(\d+)/")
+
+# Details page table cells
+INFO_HASH_LABEL_RE = re.compile(r"Info Hash", re.IGNORECASE)
+TRACKER_URL_RE = re.compile(r"udp://|http://", re.IGNORECASE)
+
+# Number of search result pages fetched at the same time
+MAX_CONCURRENT_PAGES = 3
+executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_PAGES, thread_name_prefix="page-fetch"
+)
+
+# Separate pool for cover image checks, which page workers wait on
+COVER_CHECK_THREADS = 8
+cover_executor = ThreadPoolExecutor(
+    max_workers=COVER_CHECK_THREADS, thread_name_prefix="cover-check"
+)
+
+# Cover checks are plain liveness pings, so they go straight through urllib3 with
+# no requests Session, cookie or hook handling. Each host's pool keeps a
+# connection for every cover worker, and an unreachable host fails on the
+# 2 second connect timeout while a slow one still gets 3 seconds to answer.
+# Failures of any kind, TLS errors included, are not retried; only redirects
+# are followed.
+ping_pool = urllib3.PoolManager(
+    num_pools=16,
+    maxsize=COVER_CHECK_THREADS,
+    retries=Retry(connect=0, read=0, other=0, redirect=5),
+    timeout=urllib3.Timeout(connect=2, read=3),
+    ca_certs=requests.certs.where(),
+)
+
+# Retry policy for AudiobookBay sessions. Retry objects are never mutated (urllib3
+# makes a new one for each attempt), so one instance is shared by every adapter
+SESSION_RETRY = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+
 # Define the port to be used
 FLASK_PORT = int(os.getenv("PORT", 5078))
 
@@ -69,186 +220,455 @@ def inject_nav_link():
     }
 
 
+def get_session():
+    """
+    Creates a requests session with a pooled adapter that retries transient
+    server errors.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=SESSION_RETRY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One session shared by every thread that talks to AudiobookBay: the page workers
+# and the request threads that fetch page 1 and details pages. Its connection
+# pool is thread-safe, so connections stay open across searches and downloads
+# instead of each request thread paying for a new TLS handshake.
+abb_session = get_session()
+
+
+def coalesce(inflight, key, func, *args):
+    """
+    Calls func(*args), sharing the result with every other thread that asks for
+    the same key while the call is still running.
+
+    Args:
+        inflight (dict): Map of keys to futures for calls currently running.
+        key: Identifies the call, e.g. a search query or URL.
+        func (callable): The function doing the work.
+
+    Returns:
+        The result of func(*args).
+    """
+    with CACHE_LOCK:
+        future = inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = inflight[key] = Future()
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = func(*args)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        # Also covers SystemExit and KeyboardInterrupt, so waiters are never
+        # left blocked on a future that nobody will resolve
+        future.set_exception(e)
+        raise
+    finally:
+        with CACHE_LOCK:
+            inflight.pop(key, None)
+
+
 def is_url_valid(url):
     """
     Checks if URL is valid and returns a 200 status code. Primarily used to check if cover images are accessible.
 
+    Results are remembered for a while, since the same covers come up again
+    across pages and repeated searches.
+
+    Args:
+        url (str): The URL to check.
+    """
+    # A single get() both looks up and checks expiry, so an entry can't expire
+    # between a membership test and the read
+    with CACHE_LOCK:
+        valid = cover_cache.get(url)
+    if valid is not None:
+        return valid
+
+    # When the cache entry has expired, concurrent checks of the same cover
+    # send a single request
+    return coalesce(inflight_covers, url, check_url, url)
+
+
+def check_url(url):
+    """
+    Sends a HEAD request to a URL and caches whether it returned a 200.
+
     Args:
         url (str): The URL to check.
     """
     try:
-        # Use a HEAD request with a short timeout and stream parameter
-        response = requests.head(url, timeout=3, allow_redirects=True, stream=True)
-        return response.status_code == 200
-    except requests.exceptions.RequestException:
+        host = urlparse(url).hostname
+    except ValueError:
+        # Malformed URL, e.g. an unclosed IPv6 bracket, which can't be loaded
         return False
 
+    with CACHE_LOCK:
+        host_dead = dead_cover_hosts.get(host, False)
+    if host_dead:
+        # Not cached per URL, so the cover is checked again once the host is back
+        return False
 
-# Helper function to search AudiobookBay
-def search_audiobookbay(query, max_pages=PAGE_LIMIT):
+    try:
+        response = ping_pool.request("HEAD", url)
+        if response.status in (405, 501):
+            # The host doesn't support HEAD, so check with a GET but only read
+            # the status line and headers, not the image itself. The unread body
+            # is still on the socket, so the connection is closed rather than
+            # returned to the pool, where the next check would read it as its
+            # status line.
+            response = ping_pool.request("GET", url, preload_content=False)
+            response.close()
+        valid = response.status == 200
+    except urllib3.exceptions.MaxRetryError as e:
+        if isinstance(e.reason, urllib3.exceptions.ConnectTimeoutError):
+            # Also covers NewConnectionError (refused, DNS failure)
+            with CACHE_LOCK:
+                dead_cover_hosts[host] = True
+        valid = False
+    except urllib3.exceptions.HTTPError:
+        valid = False
+
+    with CACHE_LOCK:
+        cover_cache[url] = valid
+    return valid
+
+
+def fetch_and_parse_page(query, page):
     """
-    Searches AudiobookBay for a given query and scrapes the results.
+    Fetches a single page of AudiobookBay search results and scrapes its posts.
 
     Args:
         query (str): The search term.
-        max_pages (int): The maximum number of pages to scrape.
+        page (int): The results page to fetch.
 
     Returns:
-        list: A list of dictionaries, where each dictionary represents a book
-              and contains its details.
+        tuple: A list of BookSummary objects found on the page (None if the page
+               could not be fetched) and the last page number advertised by
+               the paginator (None if there is no paginator).
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
-    }
     results = []
 
-    print(f"Searching for '{query}' on https://{ABB_HOSTNAME}...")
+    url = f"https://{ABB_HOSTNAME}/page/{page}/?s={query.lower().replace(' ', '+')}"
+    try:
+        response = abb_session.get(url, headers=HEADERS, timeout=15)
+        # Raise an exception for bad status codes (4xx or 5xx)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"[ERROR] Failed to fetch page {page}. Reason: {e}")
+        return None, None
+
+    # lxml builds the tree in C, several times faster than the pure-Python html.parser,
+    # and only the posts and paginator are kept, skipping the rest of the page
+    soup = BeautifulSoup(response.content, "lxml", parse_only=SEARCH_PAGE_STRAINER)
+    posts = SEL_POSTS.select(soup)
+
+    # If no posts are found on the page, stop paginating
+    if not posts:
+        print(f"No more results found on page {page}.")
+        return results, None
+
+    print(f"Processing {len(posts)} posts on page {page}...")
+
+    for post in posts:
+        title_element = SEL_TITLE_LINK.select_one(post)
+        if not title_element or not title_element.get("href"):
+            continue  # Skip post if title or link is not found
+
+        title = title_element.text.strip()
+        link = f"https://{ABB_HOSTNAME}{title_element['href']}"
+
+        cover_element = SEL_COVER.select_one(post)
+        cover = cover_element.get("src") if cover_element else None
 
-    for page in range(1, max_pages + 1):
-        url = f"https://{ABB_HOSTNAME}/page/{page}/?s={query.lower().replace(' ', '+')}"
         try:
-            response = requests.get(url, headers=headers, timeout=15)
-            # Raise an exception for bad status codes (4xx or 5xx)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            print(f"[ERROR] Failed to fetch page {page}. Reason: {e}")
-            break
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        posts = soup.select(".post")
-
-        # If no posts are found on the page, stop paginating
-        if not posts:
-            print(f"No more results found on page {page}.")
-            break
-
-        print(f"Processing {len(posts)} posts on page {page}...")
-
-        for post in posts:
-            try:
-                title_element = post.select_one(".postTitle > h2 > a")
-                if not title_element:
-                    continue  # Skip post if title is not found
-
-                title = title_element.text.strip()
-                link = f"https://{ABB_HOSTNAME}{title_element['href']}"
-
-                # Check if the cover URL is valid, otherwise use the default
-                cover_url = (
-                    post.select_one("img")["src"] if post.select_one("img") else None
-                )
-                if cover_url and is_url_valid(cover_url):
-                    cover = cover_url
-                else:
-                    cover = "/static/images/default_cover.jpg"
-
-                post_info = post.select_one(".postInfo")
-                post_info_text = (
-                    post_info.get_text(separator=" ", strip=True) if post_info else ""
-                )
+            metadata = parse_post_content(
+                SEL_POST_INFO.select_one(post),
+                SEL_DETAILS_PARAGRAPH.select_one(post),
+            )
+        except Exception as e:
+            print(f"[ERROR] Could not process a post. Details: {e}")
+            continue
+
+        results.append(BookSummary(title=title, link=link, cover=cover, **metadata))
+
+    # Check the covers concurrently, since each check is a network round trip,
+    # and fall back to the default cover for any that aren't reachable. Covers
+    # without an absolute http(s) URL can't be checked and are never submitted.
+    cover_checks = [
+        (
+            cover_executor.submit(is_url_valid, book.cover)
+            if book.cover and book.cover.startswith(("https://", "http://"))
+            else None
+        )
+        for book in results
+    ]
+    for book, cover_check in zip(results, cover_checks):
+        try:
+            valid = cover_check is not None and cover_check.result()
+        except Exception as e:
+            # A cover that can't be checked only costs that post its image,
+            # not the whole page
+            print(f"[ERROR] Could not check cover {book.cover}. Details: {e}")
+            valid = False
+        if not valid:
+            book.cover = "/static/images/default_cover.jpg"
+    return results, parse_last_page_number(soup)
+
+
+def parse_post_content(post_info, details_paragraph):
+    """
+    Extracts the language, post date, format, bitrate and file size of a post.
 
-                language_match = re.search(
-                    r"Language:\s*(.*?)(?:\s*Keywords:|$)", post_info_text, re.DOTALL
-                )
-                language = language_match.group(1).strip() if language_match else "N/A"
+    Args:
+        post_info (Tag): The post's .postInfo element, or None.
+        details_paragraph (Tag): The centered .postContent paragraph holding
+                                 the release details, or None.
 
-                details_paragraph = post.select_one(
-                    ".postContent p[style*='text-align:center']"
-                )
+    Returns:
+        dict: The metadata, with "N/A" for any value that couldn't be found.
+    """
+    post_info_text = post_info.get_text(separator=" ", strip=True) if post_info else ""
+
+    language_match = LANGUAGE_RE.search(post_info_text)
+    language = language_match.group(1).strip() if language_match else "N/A"
+
+    post_date, book_format, bitrate, file_size = "N/A", "N/A", "N/A", "N/A"
+
+    if details_paragraph:
+        # One scan of the paragraph picks up every label; the first occurrence
+        # of each wins, as separate searches would
+        details = {}
+        for match in DETAILS_FIELDS_RE.finditer(str(details_paragraph)):
+            details.setdefault(match.lastgroup, match)
+
+        if "posted" in details:
+            post_date = details["posted"].group("posted").strip()
+        if "format" in details:
+            book_format = details["format"].group("format").strip()
+        if "bitrate" in details:
+            bitrate = details["bitrate"].group("bitrate").strip()
+        if "size_unit" in details:
+            file_size_match = details["size_unit"]
+            file_size = (
+                f"{file_size_match.group('size').strip()} "
+                f"{file_size_match.group('size_unit').strip()}"
+            )
 
-                post_date, book_format, bitrate, file_size = "N/A", "N/A", "N/A", "N/A"
-
-                if details_paragraph:
-                    details_html = str(details_paragraph)
-
-                    post_date_match = re.search(r"Posted:\s*([^<]+)", details_html)
-                    post_date = (
-                        post_date_match.group(1).strip() if post_date_match else "N/A"
-                    )
-
-                    format_match = re.search(
-                        r"Format:\s*<span[^>]*>([^<]+)</span>", details_html
-                    )
-                    book_format = (
-                        format_match.group(1).strip() if format_match else "N/A"
-                    )
-
-                    bitrate_match = re.search(
-                        r"Bitrate:\s*<span[^>]*>([^<]+)</span>", details_html
-                    )
-                    bitrate = bitrate_match.group(1).strip() if bitrate_match else "N/A"
-
-                    file_size_match = re.search(
-                        r"File Size:\s*<span[^>]*>([^<]+)</span>\s*([^<]+)",
-                        details_html,
-                    )
-                    if file_size_match:
-                        file_size = f"{file_size_match.group(1).strip()} {file_size_match.group(2).strip()}"
-
-                results.append(
-                    {
-                        "title": title,
-                        "link": link,
-                        "cover": cover,
-                        "language": language,
-                        "post_date": post_date,
-                        "format": book_format,
-                        "bitrate": bitrate,
-                        "file_size": file_size,
-                    }
-                )
-            except Exception as e:
-                print(f"[ERROR] Could not process a post. Details: {e}")
-                continue
+    return {
+        "language": language,
+        "post_date": post_date,
+        "format": book_format,
+        "bitrate": bitrate,
+        "file_size": file_size,
+    }
+
+
+def parse_last_page_number(soup):
+    """
+    Reads the highest page number linked from the search results paginator.
+
+    Args:
+        soup (BeautifulSoup): A parsed search results page.
+
+    Returns:
+        int: The last page number, or None if the page has no paginator.
+    """
+    last_page = None
+    for page_link in SEL_PAGE_LINKS.select(soup):
+        page_match = PAGE_NUMBER_RE.search(page_link["href"])
+        if page_match:
+            last_page = max(last_page or 0, int(page_match.group(1)))
+    return last_page
+
+
+def fetch_search_pages(query, max_pages):
+    """
+    Fetches the first page of search results, then the remaining pages that
+    the site's paginator says exist, concurrently on the shared thread pool.
+
+    Args:
+        query (str): The search term.
+        max_pages (int): The maximum number of pages to scrape.
+
+    Returns:
+        tuple: The books found, in the order they appear on the site, and
+               whether every page was fetched (False if a page failed, so the
+               list may be missing results).
+    """
+    first_page, last_page = fetch_and_parse_page(query, 1)
+    if not first_page:
+        return [], first_page is not None
+
+    # Skip pages the search doesn't have. WP-PageNavi isn't rendered when all
+    # the results fit on one page, so no paginator means page 1 is the last.
+    max_pages = min(max_pages, last_page or 1)
+
+    # Keyed by link so a book repeated across pages is only listed once, in
+    # the position it first appeared
+    results_by_link = {}
+    for book in first_page:
+        results_by_link.setdefault(book.link, book)
+
+    futures = [
+        executor.submit(fetch_and_parse_page, query, page)
+        for page in range(2, max_pages + 1)
+    ]
+    future_to_page = {future: page for page, future in enumerate(futures, start=2)}
+    page_results = {}
+    next_page = 2
+    for future in as_completed(future_to_page):
+        page_results[future_to_page[future]] = future.result()[0]
+        # Consume finished pages in order, so a failed or empty page only ends
+        # pagination once every page before it has been collected
+        while next_page in page_results:
+            page_data = page_results.pop(next_page)
+            if not page_data:
+                # Earlier pages have already been consumed, so only the pages
+                # after this one can still be waiting to run
+                for f in futures[next_page - 1 :]:
+                    f.cancel()
+                # An empty page is the real end of the results, but a failed
+                # one (None) cuts the search short
+                return list(results_by_link.values()), page_data is not None
+            for book in page_data:
+                results_by_link.setdefault(book.link, book)
+            next_page += 1
+    return list(results_by_link.values()), True
+
+
+# Helper function to search AudiobookBay
+def search_audiobookbay(query, max_pages=PAGE_LIMIT):
+    """
+    Searches AudiobookBay for a given query and scrapes the results.
+
+    Results are cached for a while, so repeating a recent search doesn't
+    scrape the site again.
+
+    Args:
+        query (str): The search term.
+        max_pages (int): The maximum number of pages to scrape.
+
+    Returns:
+        list: A list of BookSummary objects, one per book found.
+    """
+    cache_key = (query.lower(), max_pages)
+    with CACHE_LOCK:
+        cached_results = search_cache.get(cache_key)
+    if cached_results is not None:
+        print(f"Returning cached results for '{query}'.")
+        return cached_results
+
+    print(f"Searching for '{query}' on https://{ABB_HOSTNAME}...")
+
+    # Identical searches that arrive while this one is running wait for it
+    # instead of scraping the same pages again
+    results, complete = coalesce(
+        inflight_searches, cache_key, fetch_search_pages, query, max_pages
+    )
+    # Results cut short by a failed page aren't cached, so the next search
+    # tries the missing pages again
+    if results and complete:
+        with CACHE_LOCK:
+            search_cache[cache_key] = results
     return results
 
 
 # Helper function to extract magnet link from details page
 def extract_magnet_link(details_url):
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
-    }
+    # Only fetch details pages from AudiobookBay itself
+    if urlparse(details_url).netloc not in ALLOWED_HOSTS:
+        print(f"[ERROR] Refusing to fetch details from an unknown host: {details_url}")
+        return None
+
+    # Concurrent requests for the same book share a single fetch
+    return coalesce(inflight_details, details_url, fetch_magnet_link, details_url)
+
+
+def fetch_magnet_link(details_url):
+    headers = HEADERS.copy()
+    with CACHE_LOCK:
+        cached = details_cache.get(details_url)
+    if cached:
+        cached_link, etag, last_modified, fetched_at = cached
+        if time.monotonic() - fetched_at < DETAILS_MAX_AGE:
+            return cached_link
+        # Ask the site whether the page changed, so an unchanged page costs a 304
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
     try:
-        response = requests.get(details_url, headers=headers)
+        response = abb_session.get(details_url, headers=headers, timeout=15)
+        if cached and response.status_code == 304:
+            with CACHE_LOCK:
+                details_cache[details_url] = (
+                    cached_link,
+                    etag,
+                    last_modified,
+                    time.monotonic(),
+                )
+            return cached_link
         if response.status_code != 200:
             print(
                 f"[ERROR] Failed to fetch details page. Status Code: {response.status_code}"
             )
             return None
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.content, "lxml")
+
+        # Find the Info Hash and the trackers in one pass over the table cells
+        info_hash = None
+        trackers = []
+        for cell in soup.find_all("td"):
+            text = cell.string
+            if text is None:
+                continue
+            if info_hash is None and INFO_HASH_LABEL_RE.search(text):
+                info_hash = cell.find_next_sibling("td").text.strip()
+            elif TRACKER_URL_RE.search(text):
+                trackers.append(text.strip())
 
-        # Extract Info Hash
-        info_hash_row = soup.find("td", string=re.compile(r"Info Hash", re.IGNORECASE))
-        if not info_hash_row:
+        if not info_hash:
             print("[ERROR] Info Hash not found on the page.")
             return None
-        info_hash = info_hash_row.find_next_sibling("td").text.strip()
-
-        # Extract Trackers
-        tracker_rows = soup.find_all(
-            "td", string=re.compile(r"udp://|http://", re.IGNORECASE)
-        )
-        trackers = [row.text.strip() for row in tracker_rows]
 
-        if not trackers:
+        if trackers:
+            trackers_query = urlencode(
+                {"tr": list(dict.fromkeys(trackers))},
+                doseq=True,
+                safe="/",
+                quote_via=quote,
+            )
+        else:
             print("[WARNING] No trackers found on the page. Using default trackers.")
-            trackers = [
-                "udp://tracker.openbittorrent.com:80",
-                "udp://opentor.org:2710",
-                "udp://tracker.ccc.de:80",
-                "udp://tracker.blackunicorn.xyz:6969",
-                "udp://tracker.coppersurfer.tk:6969",
-                "udp://tracker.leechers-paradise.org:6969",
-            ]
+            trackers_query = DEFAULT_TRACKERS_QUERY
 
         # Construct the magnet link
-        trackers_query = "&".join(
-            f"tr={requests.utils.quote(tracker)}" for tracker in trackers
-        )
         magnet_link = f"magnet:?xt=urn:btih:{info_hash}&{trackers_query}"
 
         print(f"[DEBUG] Generated Magnet Link: {magnet_link}")
+        with CACHE_LOCK:
+            details_cache[details_url] = (
+                magnet_link,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                time.monotonic(),
+            )
         return magnet_link
 
     except Exception as e:
@@ -256,21 +676,64 @@ def extract_magnet_link(details_url):
         return None
 
 
+def get_torrent_client():
+    """
+    Returns the configured download client, creating it on first use.
+
+    The client is kept for the lifetime of the process so its session is
+    reused across requests instead of being rebuilt for every call.
+
+    Returns:
+        The client for DOWNLOAD_CLIENT, or None if the client is unsupported.
+    """
+    global _torrent_client
+    with _torrent_client_lock:
+        if _torrent_client is None:
+            if DOWNLOAD_CLIENT == "qbittorrent":
+                # qbittorrent-api logs in on first use and again when the session expires
+                _torrent_client = Client(
+                    host=DL_HOST,
+                    port=DL_PORT,
+                    username=DL_USERNAME,
+                    password=DL_PASSWORD,
+                )
+            elif DOWNLOAD_CLIENT == "transmission":
+                _torrent_client = transmissionrpc(
+                    host=DL_HOST,
+                    port=DL_PORT,
+                    protocol=DL_SCHEME,
+                    username=DL_USERNAME,
+                    password=DL_PASSWORD,
+                )
+            elif DOWNLOAD_CLIENT == "delugeweb":
+                _torrent_client = delugewebclient(url=DL_URL, password=DL_PASSWORD)
+        return _torrent_client
+
+
+# Characters that aren't allowed in folder names, removed by sanitize_title()
+ILLEGAL_PATH_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+
+
 # Helper function to sanitize titles
 def sanitize_title(title):
-    return re.sub(r'[<>:"/\\|?*]', "", title).strip()
+    return title.translate(ILLEGAL_PATH_CHARS).strip()
 
 
 # Endpoint for search page
 @app.route("/", methods=["GET", "POST"])
 def search():
+    global _empty_search_html
     books = []
     query = ""
     try:
         if request.method == "POST":  # Form submitted
             query = request.form["query"]
-            if query:  # Only search if the query is not empty
-                books = search_audiobookbay(query)
+        if not query:
+            # The empty search form is identical for every visit, so render it once
+            if _empty_search_html is None:
+                _empty_search_html = render_template("search.html", books=[], query="")
+            return _empty_search_html
+        books = search_audiobookbay(query)
         return render_template("search.html", books=books, query=query)
     except Exception as e:
         print(f"[ERROR] Failed to search: {e}")
@@ -295,25 +758,17 @@ def send():
 
         save_path = f"{SAVE_PATH_BASE}/{sanitize_title(title)}"
 
+        client = get_torrent_client()
         if DOWNLOAD_CLIENT == "qbittorrent":
-            qb = Client(
-                host=DL_HOST, port=DL_PORT, username=DL_USERNAME, password=DL_PASSWORD
+            client.torrents_add(
+                urls=magnet_link, save_path=save_path, category=DL_CATEGORY
             )
-            qb.auth_log_in()
-            qb.torrents_add(urls=magnet_link, save_path=save_path, category=DL_CATEGORY)
         elif DOWNLOAD_CLIENT == "transmission":
-            transmission = transmissionrpc(
-                host=DL_HOST,
-                port=DL_PORT,
-                protocol=DL_SCHEME,
-                username=DL_USERNAME,
-                password=DL_PASSWORD,
-            )
-            transmission.add_torrent(magnet_link, download_dir=save_path)
+            client.add_torrent(magnet_link, download_dir=save_path)
         elif DOWNLOAD_CLIENT == "delugeweb":
-            delugeweb = delugewebclient(url=DL_URL, password=DL_PASSWORD)
-            delugeweb.login()
-            delugeweb.add_torrent_magnet(
+            # Deluge's web session cookie expires, so log in again before each call
+            client.login()
+            client.add_torrent_magnet(
                 magnet_link, save_directory=save_path, label=DL_CATEGORY
             )
         else:
@@ -328,61 +783,82 @@ def send():
         return jsonify({"message": str(e)}), 500
 
 
+def get_torrent_list():
+    """
+    Fetches the torrents in the configured category from the download client.
+
+    Returns:
+        list: A list of dictionaries with the name, progress, state and size of
+              each torrent, or None if the download client is unsupported.
+    """
+    client = get_torrent_client()
+    if DOWNLOAD_CLIENT == "transmission":
+        torrents = client.get_torrents()
+        return [
+            {
+                "name": torrent.name,
+                "progress": round(torrent.progress, 2),
+                "state": torrent.status,
+                "size": f"{torrent.total_size / (1024 * 1024):.2f} MB",
+            }
+            for torrent in torrents
+        ]
+    elif DOWNLOAD_CLIENT == "qbittorrent":
+        torrents = client.torrents_info(category=DL_CATEGORY)
+        return [
+            {
+                "name": torrent.name,
+                "progress": round(torrent.progress * 100, 2),
+                "state": torrent.state,
+                "size": f"{torrent.total_size / (1024 * 1024):.2f} MB",
+            }
+            for torrent in torrents
+        ]
+    elif DOWNLOAD_CLIENT == "delugeweb":
+        client.login()
+        torrents = client.get_torrents_status(
+            filter_dict={"label": DL_CATEGORY},
+            keys=["name", "state", "progress", "total_size"],
+        )
+        return [
+            {
+                "name": torrent["name"],
+                "progress": round(torrent["progress"], 2),
+                "state": torrent["state"],
+                "size": f"{torrent['total_size'] / (1024 * 1024):.2f} MB",
+            }
+            for k, torrent in torrents.result.items()
+        ]
+    return None
+
+
 @app.route("/status")
 def status():
+    global _status_ts, _status_torrents
     try:
-        if DOWNLOAD_CLIENT == "transmission":
-            transmission = transmissionrpc(
-                host=DL_HOST, port=DL_PORT, username=DL_USERNAME, password=DL_PASSWORD
-            )
-            torrents = transmission.get_torrents()
-            torrent_list = [
-                {
-                    "name": torrent.name,
-                    "progress": round(torrent.progress, 2),
-                    "state": torrent.status,
-                    "size": f"{torrent.total_size / (1024 * 1024):.2f} MB",
-                }
-                for torrent in torrents
-            ]
-            return render_template("status.html", torrents=torrent_list)
-        elif DOWNLOAD_CLIENT == "qbittorrent":
-            qb = Client(
-                host=DL_HOST, port=DL_PORT, username=DL_USERNAME, password=DL_PASSWORD
-            )
-            qb.auth_log_in()
-            torrents = qb.torrents_info(category=DL_CATEGORY)
-            torrent_list = [
-                {
-                    "name": torrent.name,
-                    "progress": round(torrent.progress * 100, 2),
-                    "state": torrent.state,
-                    "size": f"{torrent.total_size / (1024 * 1024):.2f} MB",
-                }
-                for torrent in torrents
-            ]
-        elif DOWNLOAD_CLIENT == "delugeweb":
-            delugeweb = delugewebclient(url=DL_URL, password=DL_PASSWORD)
-            delugeweb.login()
-            torrents = delugeweb.get_torrents_status(
-                filter_dict={"label": DL_CATEGORY},
-                keys=["name", "state", "progress", "total_size"],
-            )
-            torrent_list = [
-                {
-                    "name": torrent["name"],
-                    "progress": round(torrent["progress"], 2),
-                    "state": torrent["state"],
-                    "size": f"{torrent['total_size'] / (1024 * 1024):.2f} MB",
-                }
-                for k, torrent in torrents.result.items()
-            ]
-        else:
-            return jsonify({"message": "Unsupported download client"}), 400
-        return render_template("status.html", torrents=torrent_list)
+        # Reuse the last client response for a few seconds so repeated page
+        # refreshes don't each open a new RPC session with the download client
+        now = time.monotonic()
+        if _status_torrents is None or now - _status_ts >= STATUS_CACHE_TTL:
+            torrent_list = get_torrent_list()
+            if torrent_list is None:
+                return jsonify({"message": "Unsupported download client"}), 400
+            _status_torrents = torrent_list
+            _status_ts = now
+        return render_template("status.html", torrents=_status_torrents)
     except Exception as e:
         return jsonify({"message": f"Failed to fetch torrent status: {e}"}), 500
 
 
+@app.after_request
+def add_cache_headers(response):
+    # Let browsers and proxies revalidate the status page instead of re-downloading it
+    if request.endpoint == "status" and response.status_code == 200:
+        response.headers["Cache-Control"] = f"max-age={STATUS_CACHE_TTL}"
+        response.add_etag()
+        response.make_conditional(request)
+    return response
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=FLASK_PORT)